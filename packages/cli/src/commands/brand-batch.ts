@@ -0,0 +1,206 @@
+import { Command } from 'commander';
+import { readdirSync, statSync, writeFileSync } from 'fs';
+import { readFile } from 'fs/promises';
+import { extname, join } from 'path';
+import {
+  createBrandCheckResponses,
+  createAuditEntry,
+} from '@agent-resolver/core';
+import { loadBrandProfileCached } from '../utils/brand-profile.js';
+import { loadBrandConfigCached } from '../utils/brand-config.js';
+import { appendAuditEntries } from '../utils/brand-audit.js';
+import {
+  BrandProfile,
+  BrandAlignmentStatus,
+  BrandCheckRequest,
+  BrandCheckAuditEntry,
+  BrandCheckResponse,
+} from '@agent-resolver/schema';
+
+const DEFAULT_PROFILE_PATH = './brand-profile.json';
+
+/** File extensions considered checkable content */
+const CONTENT_EXTENSIONS = new Set(['.txt', '.md']);
+
+/** Separator line for the batch summary, built once at module load */
+const SUMMARY_SEPARATOR = '─'.repeat(40);
+
+/** Status display icons, precomputed lookup table */
+const STATUS_ICONS: Record<BrandAlignmentStatus, string> = {
+  'on-brand': '✅',
+  'borderline': '⚠️',
+  'off-brand': '❌',
+};
+
+/**
+ * Result of checking a single file in a batch
+ */
+interface BatchFileResult {
+  file: string;
+  response?: BrandCheckResponse;
+  error?: string;
+}
+
+/**
+ * brand batch - Check every text file in a directory
+ *
+ * Results are printed incrementally as each file completes, so large
+ * batches show progress instead of a blank terminal until the end.
+ */
+export const brandBatchCommand = new Command('batch')
+  .description('Check all .txt/.md files in a directory against the brand profile')
+  .argument('<directory>', 'Directory containing content files to check')
+  .option('-p, --profile <path>', 'Path to brand profile', DEFAULT_PROFILE_PATH)
+  .option('-t, --type <type>', 'Content type applied to every file')
+  .option('--json', 'Output results as JSON')
+  .option('-o, --output <path>', 'Write results as JSON Lines (one result per line)')
+  .option('--no-audit', 'Disable audit logging')
+  .action(async (directory, options) => {
+    try {
+      if (!statSync(directory).isDirectory()) {
+        throw new Error('not a directory');
+      }
+    } catch {
+      console.error(`✗ Directory not found: ${directory}`);
+      process.exit(1);
+    }
+
+    // Sort for deterministic processing order
+    const files = readdirSync(directory)
+      .filter((name) => CONTENT_EXTENSIONS.has(extname(name).toLowerCase()))
+      .sort()
+      .map((name) => join(directory, name));
+
+    if (files.length === 0) {
+      console.log(`No .txt or .md files found in ${directory}`);
+      return;
+    }
+
+    // Load profile
+    let profile: BrandProfile;
+    try {
+      profile = loadBrandProfileCached(options.profile);
+    } catch (error) {
+      console.error(`✗ ${(error as Error).message}`);
+      process.exit(1);
+    }
+
+    // Validate the content type flag once; per-file requests are built
+    // directly below since file contents need no schema validation
+    const typeResult = BrandCheckRequest.shape.contentType.safeParse(options.type);
+    if (!typeResult.success) {
+      console.error(`✗ Invalid content type: ${options.type}`);
+      process.exit(1);
+    }
+    const contentType = typeResult.data;
+
+    if (!options.json) {
+      console.log(`\nChecking ${files.length} files against ${profile.name} v${profile.version}\n`);
+    }
+
+    const results: BatchFileResult[] = [];
+    const auditEntries: BrandCheckAuditEntry[] = [];
+
+    // Single timestamp shared by every result in this batch run
+    const checkedAt = new Date().toISOString();
+
+    // Read all files concurrently so disk latency overlaps instead of
+    // accumulating serially before any checking starts
+    const reads = await Promise.all(
+      files.map(async (file): Promise<{ file: string; content?: string; error?: string }> => {
+        try {
+          return { file, content: await readFile(file, 'utf-8') };
+        } catch (error) {
+          return { file, error: (error as Error).message };
+        }
+      })
+    );
+
+    // One request per readable, non-empty file, checked through the
+    // core batch API: duplicate files share one check and a failing
+    // item surfaces as a per-file error instead of aborting the run
+    const requests: BrandCheckRequest[] = [];
+    for (const read of reads) {
+      if (read.content !== undefined && read.content.length > 0) {
+        requests.push({ content: read.content, contentType });
+      }
+    }
+    const batchItems = createBrandCheckResponses(profile, requests, checkedAt);
+
+    let itemIndex = 0;
+    for (const read of reads) {
+      let result: BatchFileResult;
+      if (read.content === undefined) {
+        result = { file: read.file, error: read.error };
+      } else if (read.content.length === 0) {
+        result = { file: read.file, error: 'File is empty' };
+      } else {
+        const item = batchItems[itemIndex++];
+        if (item.status === 'ok') {
+          result = { file: read.file, response: item.response };
+          auditEntries.push(createAuditEntry(profile, item.response));
+        } else {
+          result = { file: read.file, error: item.error };
+        }
+      }
+
+      results.push(result);
+
+      // Stream each result as soon as it is ready
+      if (!options.json) {
+        if (result.response) {
+          const icon = STATUS_ICONS[result.response.status];
+          console.log(`${icon} ${result.file} - ${result.response.status} (${result.response.confidence}%)`);
+        } else {
+          console.log(`✗ ${result.file} - ${result.error}`);
+        }
+      }
+    }
+
+    // Log audit entries in a single write if enabled
+    const config = loadBrandConfigCached();
+    if (options.audit && config.auditEnabled && auditEntries.length > 0) {
+      try {
+        appendAuditEntries(config.auditPath, auditEntries);
+      } catch (error) {
+        console.error(`Warning: Failed to write audit log: ${(error as Error).message}`);
+      }
+    }
+
+    // Write machine-readable results for non-interactive pipelines
+    if (options.output) {
+      try {
+        const lines = results.map((result) => JSON.stringify(result)).join('\n') + '\n';
+        writeFileSync(options.output, lines.replace(/\r\n/g, '\n'), 'utf-8');
+        if (!options.json) {
+          console.log(`\nResults written to ${options.output}`);
+        }
+      } catch (error) {
+        console.error(`✗ Failed to write results: ${(error as Error).message}`);
+        process.exit(1);
+      }
+    }
+
+    if (options.json) {
+      console.log(JSON.stringify(results, null, 2));
+    } else {
+      const onBrand = results.filter((r) => r.response?.status === 'on-brand').length;
+      const borderline = results.filter((r) => r.response?.status === 'borderline').length;
+      const offBrand = results.filter((r) => r.response?.status === 'off-brand').length;
+      const failed = results.filter((r) => r.error !== undefined).length;
+
+      // Emit the summary as a single write
+      const summaryLines = [
+        '',
+        SUMMARY_SEPARATOR,
+        `Summary: ✅ ${onBrand} | ⚠️  ${borderline} | ❌ ${offBrand}${failed > 0 ? ` | ✗ ${failed} failed` : ''}`,
+        '',
+      ];
+      console.log(summaryLines.join('\n'));
+    }
+
+    // Exit with appropriate code
+    if (results.some((r) => r.response?.status === 'off-brand' || r.error !== undefined)) {
+      process.exit(1);
+    }
+  });
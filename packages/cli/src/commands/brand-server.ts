@@ -1,92 +1,44 @@
 import { Command } from 'commander';
 import { createServer, IncomingMessage, ServerResponse } from 'http';
 import { readFileSync, existsSync } from 'fs';
+import { setImmediate as yieldToEventLoop } from 'timers/promises';
 import { dirname, join } from 'path';
 import { fileURLToPath } from 'url';
 import {
   createBrandCheckResponse,
   createAuditEntry,
-  validateBrandProfile,
+  iterateBrandCheckResponses,
   validateBrandCheckRequest,
 } from '@agent-resolver/core';
+import {
+  loadBrandProfileCached,
+  loadBrandProfileCachedAsync,
+} from '../utils/brand-profile.js';
+import { loadBrandConfigCached } from '../utils/brand-config.js';
+import { appendAuditEntries } from '../utils/brand-audit.js';
 import {
   BrandProfile,
   BrandConfig,
+  BrandAlignmentStatus,
+  BrandCheckRequest,
+  BrandCheckRequestList,
   BrandCheckAuditEntry,
 } from '@agent-resolver/schema';
 
 const DEFAULT_PROFILE_PATH = './brand-profile.json';
-const DEFAULT_CONFIG_PATH = './.brandrc.json';
-const DEFAULT_AUDIT_PATH = './brand-audit.json';
+
+/** Status display icons, precomputed lookup table */
+const STATUS_ICONS: Record<BrandAlignmentStatus, string> = {
+  'on-brand': '✅',
+  'borderline': '⚠️',
+  'off-brand': '❌',
+};
 
 // Get the directory of the current module for serving UI files
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = dirname(__filename);
 const UI_DIR = join(__dirname, '..', 'ui');
 
-/**
- * Read and parse JSON file
- */
-function readJsonFile(path: string): unknown {
-  if (!existsSync(path)) {
-    throw new Error(`File not found: ${path}`);
-  }
-  const content = readFileSync(path, 'utf-8');
-  return JSON.parse(content);
-}
-
-/**
- * Write JSON to file
- */
-function writeJsonFile(path: string, data: unknown): void {
-  const { writeFileSync } = require('fs');
-  const content = JSON.stringify(data, null, 2) + '\n';
-  writeFileSync(path, content.replace(/\r\n/g, '\n'), 'utf-8');
-}
-
-/**
- * Load brand configuration
- */
-function loadBrandConfig(): BrandConfig {
-  if (existsSync(DEFAULT_CONFIG_PATH)) {
-    const data = readJsonFile(DEFAULT_CONFIG_PATH);
-    const result = BrandConfig.safeParse(data);
-    if (result.success) {
-      return result.data;
-    }
-  }
-  return BrandConfig.parse({});
-}
-
-/**
- * Load brand profile
- */
-function loadBrandProfile(path: string): BrandProfile {
-  const data = readJsonFile(path);
-  const result = validateBrandProfile(data);
-  if (!result.success) {
-    throw new Error(`Invalid brand profile:\n  ${result.errors.join('\n  ')}`);
-  }
-  return result.data;
-}
-
-/**
- * Append audit entry
- */
-function appendAuditEntry(path: string, entry: BrandCheckAuditEntry): void {
-  let entries: BrandCheckAuditEntry[] = [];
-  if (existsSync(path)) {
-    try {
-      const content = readFileSync(path, 'utf-8');
-      entries = JSON.parse(content);
-    } catch {
-      entries = [];
-    }
-  }
-  entries.push(entry);
-  writeJsonFile(path, entries);
-}
-
 /**
  * Parse request body
  */
@@ -111,7 +63,9 @@ function sendJson(res: ServerResponse, statusCode: number, data: unknown): void
     'Access-Control-Allow-Methods': 'POST, OPTIONS',
     'Access-Control-Allow-Headers': 'Content-Type',
   });
-  res.end(JSON.stringify(data, null, 2));
+  // Compact output: responses are machine-consumed, and skipping
+  // indentation cuts both serialization work and bytes on the wire
+  res.end(JSON.stringify(data));
 }
 
 /**
@@ -154,11 +108,11 @@ function serveStaticFile(res: ServerResponse, filePath: string): boolean {
 /**
  * Create the HTTP request handler
  */
-function createHandler(profilePath: string, config: BrandConfig, enableUI: boolean) {
+function createHandler(profilePath: string, config: BrandConfig, enableUI: boolean, quiet = false) {
   // Pre-load profile for validation
   let profile: BrandProfile;
   try {
-    profile = loadBrandProfile(profilePath);
+    profile = loadBrandProfileCached(profilePath);
   } catch (error) {
     console.error(`✗ Failed to load brand profile: ${(error as Error).message}`);
     process.exit(1);
@@ -213,7 +167,7 @@ function createHandler(profilePath: string, config: BrandConfig, enableUI: boole
       try {
         // Reload profile on each request to pick up changes
         try {
-          profile = loadBrandProfile(profilePath);
+          profile = await loadBrandProfileCachedAsync(profilePath);
         } catch (error) {
           sendJson(res, 500, {
             error: 'Failed to load brand profile',
@@ -252,17 +206,17 @@ function createHandler(profilePath: string, config: BrandConfig, enableUI: boole
         if (config.auditEnabled) {
           try {
             const entry = createAuditEntry(profile, response);
-            appendAuditEntry(config.auditPath, entry);
+            appendAuditEntries(config.auditPath, [entry]);
           } catch (error) {
             console.error(`Warning: Failed to write audit log: ${(error as Error).message}`);
           }
         }
 
-        // Log request
-        const statusIcon = response.status === 'on-brand' ? '✅'
-          : response.status === 'borderline' ? '⚠️'
-          : '❌';
-        console.log(`${statusIcon} ${new Date().toISOString()} - ${response.status} (${response.confidence}%)`);
+        // Log request unless quiet; the guard also skips building the
+        // log line, so disabled logging costs nothing per request
+        if (!quiet) {
+          console.log(`${STATUS_ICONS[response.status]} ${new Date().toISOString()} - ${response.status} (${response.confidence}%)`);
+        }
 
         sendJson(res, 200, response);
         return;
@@ -276,12 +230,137 @@ function createHandler(profilePath: string, config: BrandConfig, enableUI: boole
       }
     }
 
+    // Batch brand check endpoint - streams one SSE event per item
+    if (url.pathname === '/on-brand/check-batch' && req.method === 'POST') {
+      try {
+        // Reload profile once for the whole batch
+        try {
+          profile = await loadBrandProfileCachedAsync(profilePath);
+        } catch (error) {
+          sendJson(res, 500, {
+            error: 'Failed to load brand profile',
+            message: (error as Error).message,
+          });
+          return;
+        }
+
+        // Parse request body
+        const body = await parseBody(req);
+        let requestData: unknown;
+        try {
+          requestData = JSON.parse(body);
+        } catch {
+          sendJson(res, 400, {
+            error: 'Invalid JSON',
+            message: 'Request body must be valid JSON',
+          });
+          return;
+        }
+
+        // Validate all items before the stream starts, since the
+        // status code cannot change once events are being written.
+        // Guard the property read: valid JSON need not be an object.
+        const items =
+          typeof requestData === 'object' && requestData !== null
+            ? (requestData as { items?: unknown }).items
+            : undefined;
+        if (!Array.isArray(items) || items.length === 0) {
+          sendJson(res, 400, {
+            error: 'Invalid request',
+            message: 'Request body must contain a non-empty "items" array',
+          });
+          return;
+        }
+
+        // One parse of the whole list through the prebuilt schema
+        // instead of a per-item validation loop
+        const listResult = BrandCheckRequestList.safeParse(items);
+        if (!listResult.success) {
+          sendJson(res, 400, {
+            error: 'Invalid request',
+            details: listResult.error.errors.map((e) => {
+              // Item-level errors have no sub-path to append
+              const subPath = e.path.length > 1 ? `.${e.path.slice(1).join('.')}` : '';
+              return `items[${e.path[0]}]${subPath}: ${e.message}`;
+            }),
+          });
+          return;
+        }
+        const requests: BrandCheckRequest[] = listResult.data;
+
+        res.writeHead(200, {
+          'Content-Type': 'text/event-stream',
+          'Cache-Control': 'no-cache',
+          'Connection': 'keep-alive',
+          'Access-Control-Allow-Origin': '*',
+        });
+
+        const auditEntries: BrandCheckAuditEntry[] = [];
+        const counts = { 'on-brand': 0, 'borderline': 0, 'off-brand': 0 };
+        let errored = 0;
+
+        // Single timestamp shared by every result in this batch
+        const checkedAt = new Date().toISOString();
+
+        // Core batch iterator: input order, duplicate fan-out, and
+        // per-item error isolation, so one bad item cannot abort the
+        // stream mid-flight
+        for (const item of iterateBrandCheckResponses(profile, requests, checkedAt)) {
+          if (item.status === 'ok') {
+            counts[item.response.status]++;
+            if (config.auditEnabled) {
+              auditEntries.push(createAuditEntry(profile, item.response));
+            }
+
+            // Emit each result as soon as it is ready
+            res.write(`data: ${JSON.stringify(item.response)}\n\n`);
+          } else {
+            errored++;
+            res.write(`data: ${JSON.stringify({ error: item.error })}\n\n`);
+          }
+
+          // Yield between items so a large batch does not starve
+          // concurrently arriving requests on the event loop
+          await yieldToEventLoop();
+        }
+
+        // Write audit entries in a single append
+        if (auditEntries.length > 0) {
+          try {
+            appendAuditEntries(config.auditPath, auditEntries);
+          } catch (error) {
+            console.error(`Warning: Failed to write audit log: ${(error as Error).message}`);
+          }
+        }
+
+        if (!quiet) {
+          console.log(`📦 ${new Date().toISOString()} - batch of ${requests.length} checks`);
+        }
+
+        res.write(`event: done\ndata: ${JSON.stringify({ total: requests.length, ...counts, errors: errored })}\n\n`);
+        res.end();
+        return;
+      } catch (error) {
+        console.error('Error processing batch request:', error);
+        if (!res.headersSent) {
+          sendJson(res, 500, {
+            error: 'Internal server error',
+            message: (error as Error).message,
+          });
+        } else {
+          res.end();
+        }
+        return;
+      }
+    }
+
     // 404 for unknown routes
     sendJson(res, 404, {
       error: 'Not found',
       message: `Unknown endpoint: ${req.method} ${url.pathname}`,
       availableEndpoints: {
         'POST /on-brand/check': 'Check content for brand consistency',
+        'POST /on-brand/check-batch': 'Check multiple contents, streamed as server-sent events',
         'GET /health': 'Health check',
       },
     });
@@ -297,11 +376,12 @@ export const brandServeCommand = new Command('serve')
   .option('--port <number>', 'Server port', '3000')
   .option('--host <string>', 'Server host', 'localhost')
   .option('--ui', 'Enable web UI at root path')
+  .option('--quiet', 'Disable per-request logging')
   .action((options) => {
     const port = parseInt(options.port, 10);
     const host = options.host;
     const enableUI = !!options.ui;
-    const config = loadBrandConfig();
+    const config = loadBrandConfigCached();
 
     // Check if profile exists
     if (!existsSync(options.profile)) {
@@ -310,9 +390,14 @@ export const brandServeCommand = new Command('serve')
       process.exit(1);
     }
 
-    const handler = createHandler(options.profile, config, enableUI);
+    const handler = createHandler(options.profile, config, enableUI, !!options.quiet);
     const server = createServer(handler);
 
+    // Keep client connections open between checks so repeat callers
+    // (the web UI, batch scripts) skip the TCP handshake per request
+    server.keepAliveTimeout = 60_000;
+    server.headersTimeout = 65_000;
+
     server.listen(port, host, () => {
       console.log(`\n🚀 Brand Check API Server running at http://${host}:${port}`);
       console.log('\nEndpoints:');
@@ -320,6 +405,7 @@ export const brandServeCommand = new Command('serve')
         console.log(`  GET  http://${host}:${port}/          (Web UI)`);
       }
       console.log(`  POST http://${host}:${port}/on-brand/check`);
+      console.log(`  POST http://${host}:${port}/on-brand/check-batch`);
       console.log(`  GET  http://${host}:${port}/health`);
       if (!enableUI) {
         console.log('\nTip: Add --ui flag to enable the web interface');
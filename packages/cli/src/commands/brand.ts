@@ -1,37 +1,40 @@
 import { Command } from 'commander';
-import { readFileSync, writeFileSync, existsSync, appendFileSync } from 'fs';
+import { readFileSync, writeFileSync, existsSync } from 'fs';
 import { brandServeCommand } from './brand-server.js';
+import { brandBatchCommand } from './brand-batch.js';
+import { loadBrandProfileCached } from '../utils/brand-profile.js';
+import { loadBrandConfigCached } from '../utils/brand-config.js';
+import { appendAuditEntries } from '../utils/brand-audit.js';
 import {
   createBrandCheckResponse,
   createAuditEntry,
-  validateBrandProfile,
   validateBrandCheckRequest,
   formatStatusDisplay,
 } from '@agent-resolver/core';
 import {
   BrandProfile,
-  BrandConfig,
+  BrandAlignmentStatus,
   BrandCheckAuditEntry,
 } from '@agent-resolver/schema';
 
 const DEFAULT_PROFILE_PATH = './brand-profile.json';
-const DEFAULT_CONFIG_PATH = './.brandrc.json';
 const DEFAULT_AUDIT_PATH = './brand-audit.json';
 
-/**
- * Read and parse JSON file
- */
-function readJsonFile(path: string): unknown {
-  if (!existsSync(path)) {
-    throw new Error(`File not found: ${path}`);
-  }
-  const content = readFileSync(path, 'utf-8');
-  try {
-    return JSON.parse(content);
-  } catch {
-    throw new Error(`Invalid JSON in file: ${path}`);
-  }
-}
+/** Separator lines, built once at module load */
+const RESULT_SEPARATOR = '─'.repeat(50);
+const SUMMARY_SEPARATOR = '─'.repeat(40);
+
+/** Display icons, precomputed lookup tables */
+const STATUS_ICONS: Record<BrandAlignmentStatus, string> = {
+  'on-brand': '✅',
+  'borderline': '⚠️',
+  'off-brand': '❌',
+};
+const SEVERITY_ICONS: Record<'info' | 'warning' | 'critical', string> = {
+  critical: '❌',
+  warning: '⚠️',
+  info: 'ℹ️',
+};
 
 /**
  * Write JSON to file with LF newlines
@@ -41,52 +44,6 @@ function writeJsonFile(path: string, data: unknown): void {
   writeFileSync(path, content.replace(/\r\n/g, '\n'), 'utf-8');
 }
 
-/**
- * Load brand configuration
- */
-function loadBrandConfig(): BrandConfig {
-  if (existsSync(DEFAULT_CONFIG_PATH)) {
-    const data = readJsonFile(DEFAULT_CONFIG_PATH);
-    const result = BrandConfig.safeParse(data);
-    if (result.success) {
-      return result.data;
-    }
-  }
-  return BrandConfig.parse({});
-}
-
-/**
- * Load brand profile
- */
-function loadBrandProfile(path: string): BrandProfile {
-  const data = readJsonFile(path);
-  const result = validateBrandProfile(data);
-  if (!result.success) {
-    throw new Error(`Invalid brand profile:\n  ${result.errors.join('\n  ')}`);
-  }
-  return result.data;
-}
-
-/**
- * Append audit entry to audit log
- */
-function appendAuditEntry(path: string, entry: BrandCheckAuditEntry): void {
-  let entries: BrandCheckAuditEntry[] = [];
-
-  if (existsSync(path)) {
-    try {
-      const content = readFileSync(path, 'utf-8');
-      entries = JSON.parse(content);
-    } catch {
-      // Start fresh if file is corrupted
-      entries = [];
-    }
-  }
-
-  entries.push(entry);
-  writeJsonFile(path, entries);
-}
-
 /**
  * brand init - Initialize a new brand profile
  */
@@ -172,11 +129,13 @@ export const brandCheckCommand = new Command('check')
     if (options.content) {
       content = options.content;
     } else if (options.file) {
-      if (!existsSync(options.file)) {
+      // Single read instead of exists-then-read (one syscall, no race)
+      try {
+        content = readFileSync(options.file, 'utf-8');
+      } catch {
         console.error(`✗ Content file not found: ${options.file}`);
         process.exit(1);
       }
-      content = readFileSync(options.file, 'utf-8');
     } else {
       console.error('✗ Please provide content using --content or --file');
       process.exit(1);
@@ -185,7 +144,7 @@ export const brandCheckCommand = new Command('check')
     // Load profile
     let profile: BrandProfile;
     try {
-      profile = loadBrandProfile(options.profile);
+      profile = loadBrandProfileCached(options.profile);
     } catch (error) {
       console.error(`✗ ${(error as Error).message}`);
       process.exit(1);
@@ -209,11 +168,11 @@ export const brandCheckCommand = new Command('check')
     const response = createBrandCheckResponse(profile, requestResult.data);
 
     // Log audit entry if enabled
-    const config = loadBrandConfig();
+    const config = loadBrandConfigCached();
     if (options.audit && config.auditEnabled) {
       const entry = createAuditEntry(profile, response);
       try {
-        appendAuditEntry(config.auditPath, entry);
+        appendAuditEntries(config.auditPath, [entry]);
       } catch (error) {
         console.error(`Warning: Failed to write audit log: ${(error as Error).message}`);
       }
@@ -223,15 +182,12 @@ export const brandCheckCommand = new Command('check')
     if (options.json) {
       console.log(JSON.stringify(response, null, 2));
     } else {
-      console.log('\n' + '─'.repeat(50));
+      console.log('\n' + RESULT_SEPARATOR);
       console.log(`  ${response.statusDisplay}`);
-      console.log('─'.repeat(50));
+      console.log(RESULT_SEPARATOR);
       console.log('\nExplanation:');
       for (const explanation of response.explanations) {
-        const icon = explanation.severity === 'critical' ? '❌'
-          : explanation.severity === 'warning' ? '⚠️'
-          : 'ℹ️';
-        console.log(`  ${icon} ${explanation.text}`);
+        console.log(`  ${SEVERITY_ICONS[explanation.severity]} ${explanation.text}`);
       }
       if (response.confidence !== undefined) {
         console.log(`\nConfidence: ${response.confidence}%`);
@@ -256,7 +212,7 @@ export const brandProfileCommand = new Command('profile')
   .action((options) => {
     let profile: BrandProfile;
     try {
-      profile = loadBrandProfile(options.profile);
+      profile = loadBrandProfileCached(options.profile);
     } catch (error) {
       console.error(`✗ ${(error as Error).message}`);
       process.exit(1);
@@ -352,11 +308,8 @@ export const brandAuditCommand = new Command('audit')
     console.log(`\n📊 Brand Check Audit Log (${recent.length} of ${entries.length} entries)\n`);
 
     for (const entry of recent) {
-      const statusIcon = entry.status === 'on-brand' ? '✅'
-        : entry.status === 'borderline' ? '⚠️'
-        : '❌';
       const date = new Date(entry.timestamp).toLocaleString();
-      console.log(`${statusIcon} ${date}`);
+      console.log(`${STATUS_ICONS[entry.status]} ${date}`);
       console.log(`   Profile: ${entry.profileName} v${entry.profileVersion}`);
       console.log(`   Content: ${entry.contentHash.substring(0, 16)}...`);
       if (entry.confidence !== undefined) {
@@ -370,7 +323,7 @@ export const brandAuditCommand = new Command('audit')
     const borderline = entries.filter(e => e.status === 'borderline').length;
     const offBrand = entries.filter(e => e.status === 'off-brand').length;
 
-    console.log('─'.repeat(40));
+    console.log(SUMMARY_SEPARATOR);
     console.log(`Summary: ✅ ${onBrand} | ⚠️  ${borderline} | ❌ ${offBrand}`);
     console.log('');
   });
@@ -382,6 +335,7 @@ export const brandCommand = new Command('brand')
   .description('Brand consistency checker - Is this on brand?')
   .addCommand(brandInitCommand)
   .addCommand(brandCheckCommand)
+  .addCommand(brandBatchCommand)
   .addCommand(brandProfileCommand)
   .addCommand(brandAuditCommand)
   .addCommand(brandServeCommand);
@@ -0,0 +1,27 @@
+import { readFileSync, writeFileSync } from 'fs';
+import { BrandCheckAuditEntry } from '@agent-resolver/schema';
+
+/**
+ * Append audit entries to the audit log in a single read and write.
+ *
+ * The log is one JSON array, so appending means read-modify-write;
+ * taking the whole batch at once keeps that to one pass per flush
+ * instead of one per entry.
+ */
+export function appendAuditEntries(
+  path: string,
+  newEntries: readonly BrandCheckAuditEntry[]
+): void {
+  let entries: BrandCheckAuditEntry[] = [];
+
+  try {
+    entries = JSON.parse(readFileSync(path, 'utf-8'));
+  } catch {
+    // Start fresh if the file is missing or corrupted
+    entries = [];
+  }
+
+  entries.push(...newEntries);
+  const content = JSON.stringify(entries, null, 2) + '\n';
+  writeFileSync(path, content.replace(/\r\n/g, '\n'), 'utf-8');
+}
@@ -0,0 +1,58 @@
+import { readFileSync, statSync } from 'fs';
+import { resolve } from 'path';
+import { BrandConfig } from '@agent-resolver/schema';
+
+const DEFAULT_CONFIG_PATH = './.brandrc.json';
+
+/**
+ * Cached parsed config, keyed by resolved path
+ */
+interface CachedConfig {
+  mtimeMs: number;
+  config: BrandConfig;
+}
+
+const configCache = new Map<string, CachedConfig>();
+
+/** Schema defaults, materialized once; callers must not mutate */
+const DEFAULT_CONFIG: BrandConfig = BrandConfig.parse({});
+
+/**
+ * Load brand configuration, reusing the parsed object until the file
+ * changes. Falls back to defaults when the file is missing or invalid,
+ * matching the previous per-command loaders.
+ */
+export function loadBrandConfigCached(path: string = DEFAULT_CONFIG_PATH): BrandConfig {
+  const key = resolve(path);
+
+  let mtimeMs: number;
+  try {
+    mtimeMs = statSync(key).mtimeMs;
+  } catch {
+    return DEFAULT_CONFIG;
+  }
+
+  const cached = configCache.get(key);
+  if (cached !== undefined && cached.mtimeMs === mtimeMs) {
+    return cached.config;
+  }
+
+  try {
+    const data: unknown = JSON.parse(readFileSync(key, 'utf-8'));
+    const result = BrandConfig.safeParse(data);
+    if (result.success) {
+      configCache.set(key, { mtimeMs, config: result.data });
+      return result.data;
+    }
+  } catch {
+    // Fall through to defaults on unreadable or invalid JSON
+  }
+  return DEFAULT_CONFIG;
+}
+
+/**
+ * Clear the brand config cache
+ */
+export function clearBrandConfigCache(): void {
+  configCache.clear();
+}
@@ -0,0 +1,95 @@
+import { readFileSync, statSync } from 'fs';
+import { readFile, stat } from 'fs/promises';
+import { resolve } from 'path';
+import { prepareBrandProfile, validateBrandProfile } from '@agent-resolver/core';
+import { BrandProfile } from '@agent-resolver/schema';
+
+/**
+ * Cached parsed profile, keyed by resolved path
+ */
+interface CachedProfile {
+  mtimeMs: number;
+  size: number;
+  profile: BrandProfile;
+}
+
+const profileCache = new Map<string, CachedProfile>();
+
+/**
+ * Parse and validate brand profile JSON
+ */
+function parseBrandProfile(content: string, path: string): BrandProfile {
+  let data: unknown;
+  try {
+    data = JSON.parse(content);
+  } catch {
+    throw new Error(`Invalid JSON in file: ${path}`);
+  }
+  const result = validateBrandProfile(data);
+  if (!result.success) {
+    throw new Error(`Invalid brand profile:\n  ${result.errors.join('\n  ')}`);
+  }
+  // Warm the checker's prepared view so the first check after a (re)load
+  // does not pay the automaton build
+  prepareBrandProfile(result.data);
+  return result.data;
+}
+
+/**
+ * Load a brand profile, reusing the parsed object until the file changes.
+ *
+ * The cache is keyed by resolved path and invalidated by mtime and size,
+ * so repeated loads (per server request, per batch file) skip the JSON
+ * parse and schema validation unless the profile was edited. Returning
+ * the same object also preserves the per-profile structures core caches
+ * by identity (phrase automaton, cache keys).
+ */
+export function loadBrandProfileCached(path: string): BrandProfile {
+  const key = resolve(path);
+
+  let stats;
+  try {
+    stats = statSync(key);
+  } catch {
+    throw new Error(`File not found: ${path}`);
+  }
+
+  const cached = profileCache.get(key);
+  if (cached !== undefined && cached.mtimeMs === stats.mtimeMs && cached.size === stats.size) {
+    return cached.profile;
+  }
+
+  const profile = parseBrandProfile(readFileSync(key, 'utf-8'), path);
+  profileCache.set(key, { mtimeMs: stats.mtimeMs, size: stats.size, profile });
+  return profile;
+}
+
+/**
+ * Async variant of loadBrandProfileCached for the server request path
+ */
+export async function loadBrandProfileCachedAsync(path: string): Promise<BrandProfile> {
+  const key = resolve(path);
+
+  let stats;
+  try {
+    stats = await stat(key);
+  } catch {
+    throw new Error(`File not found: ${path}`);
+  }
+
+  const cached = profileCache.get(key);
+  if (cached !== undefined && cached.mtimeMs === stats.mtimeMs && cached.size === stats.size) {
+    return cached.profile;
+  }
+
+  const profile = parseBrandProfile(await readFile(key, 'utf-8'), path);
+  profileCache.set(key, { mtimeMs: stats.mtimeMs, size: stats.size, profile });
+  return profile;
+}
+
+/**
+ * Clear the brand profile cache
+ */
+export function clearBrandProfileCache(): void {
+  profileCache.clear();
+}
@@ -1,9 +1,12 @@
 import { describe, it, expect } from 'vitest';
 import {
   checkBrandConsistency,
+  clearBrandCheckCache,
   computeContentHash,
+  contentFingerprint,
   generateAuditId,
   createBrandCheckResponse,
+  createBrandCheckResponses,
   createAuditEntry,
   validateBrandProfile,
   validateBrandCheckRequest,
@@ -51,6 +54,20 @@ describe('computeContentHash', () => {
   });
 });
 
+describe('contentFingerprint', () => {
+  it('should produce consistent fingerprint for same content', () => {
+    expect(contentFingerprint('test content')).toBe(contentFingerprint('test content'));
+  });
+
+  it('should produce different fingerprint for different content', () => {
+    expect(contentFingerprint('content A')).not.toBe(contentFingerprint('content B'));
+  });
+
+  it('should produce a 32 character hex string', () => {
+    expect(contentFingerprint('test content')).toMatch(/^[a-f0-9]{32}$/);
+  });
+});
+
 describe('generateAuditId', () => {
   it('should produce consistent ID for same inputs', () => {
     const id1 = generateAuditId('hash123', '2024-01-01T00:00:00.000Z');
@@ -235,6 +252,51 @@ describe('checkBrandConsistency', () => {
     });
   });
 
+  describe('result caching', () => {
+    it('should return the cached result for repeated checks', () => {
+      const profile = createTestProfile();
+      const request = createTestRequest('Repeatedly checked content');
+
+      const result1 = checkBrandConsistency(profile, request);
+      const result2 = checkBrandConsistency(profile, request);
+
+      expect(result2).toBe(result1);
+    });
+
+    it('should recompute after the cache is cleared', () => {
+      const profile = createTestProfile();
+      const request = createTestRequest('Content checked before and after clearing');
+
+      const result1 = checkBrandConsistency(profile, request);
+      clearBrandCheckCache();
+      const result2 = checkBrandConsistency(profile, request);
+
+      expect(result2).not.toBe(result1);
+      expect(result2).toEqual(result1);
+    });
+
+    it('should share cached results across case and whitespace variants', () => {
+      const profile = createTestProfile();
+
+      const result1 = checkBrandConsistency(profile, createTestRequest('Buy our  Quality product'));
+      const result2 = checkBrandConsistency(profile, createTestRequest('buy our quality PRODUCT'));
+
+      expect(result2).toBe(result1);
+    });
+
+    it('should not mix results across different profiles', () => {
+      const strict = createTestProfile({ neverRules: ['products'] });
+      const lenient = createTestProfile({ neverRules: [] });
+      const request = createTestRequest('We offer products and services.');
+
+      const strictResult = checkBrandConsistency(strict, request);
+      const lenientResult = checkBrandConsistency(lenient, request);
+
+      expect(strictResult.status).toBe('off-brand');
+      expect(lenientResult.status).not.toBe('off-brand');
+    });
+  });
+
   describe('explanations', () => {
     it('should provide 1-3 explanations', () => {
       const profile = createTestProfile();
@@ -312,6 +374,110 @@ describe('createBrandCheckResponse', () => {
   });
 });
 
+describe('createBrandCheckResponses', () => {
+  it('should return results in input order', () => {
+    const profile = createTestProfile();
+    const requests = [
+      createTestRequest('Our quality and innovation help you succeed.'),
+      createTestRequest('This contains profanity which is bad'),
+      createTestRequest('We offer products and services.'),
+    ];
+
+    const results = createBrandCheckResponses(profile, requests, '2024-01-01T00:00:00.000Z');
+
+    expect(results).toHaveLength(3);
+    for (const [i, result] of results.entries()) {
+      expect(result.status).toBe('ok');
+      if (result.status === 'ok') {
+        expect(result.response.contentHash).toBe(computeContentHash(requests[i].content));
+      }
+    }
+  });
+
+  it('should match single-check responses item for item', () => {
+    const profile = createTestProfile();
+    const requests = [
+      createTestRequest('We help you succeed with innovative solutions.'),
+      createTestRequest('Our competitors are terrible!'),
+    ];
+    const timestamp = '2024-01-01T00:00:00.000Z';
+
+    const results = createBrandCheckResponses(profile, requests, timestamp);
+
+    for (const [i, result] of results.entries()) {
+      expect(result.status).toBe('ok');
+      if (result.status === 'ok') {
+        expect(result.response).toEqual(
+          createBrandCheckResponse(profile, requests[i], timestamp)
+        );
+      }
+    }
+  });
+
+  it('should isolate per-item failures without aborting the batch', () => {
+    const profile = createTestProfile();
+    const poisoned = {
+      get content(): string {
+        throw new Error('boom');
+      },
+    } as unknown as BrandCheckRequest;
+    const requests = [createTestRequest('Good content'), poisoned, createTestRequest('More content')];
+
+    const results = createBrandCheckResponses(profile, requests, '2024-01-01T00:00:00.000Z');
+
+    expect(results).toHaveLength(3);
+    expect(results[0].status).toBe('ok');
+    expect(results[1].status).toBe('error');
+    if (results[1].status === 'error') {
+      expect(results[1].error).toBe('boom');
+    }
+    expect(results[2].status).toBe('ok');
+  });
+
+  it('should rethrow the first failure when failFast is set', () => {
+    const profile = createTestProfile();
+    const poisoned = {
+      get content(): string {
+        throw new Error('boom');
+      },
+    } as unknown as BrandCheckRequest;
+
+    expect(() =>
+      createBrandCheckResponses(profile, [createTestRequest('Good content'), poisoned], undefined, true)
+    ).toThrow('boom');
+  });
+
+  it('should check duplicate contents once and share the result', () => {
+    const profile = createTestProfile();
+    const requests = [
+      createTestRequest('Templated boilerplate disclaimer.'),
+      createTestRequest('Unique campaign copy about quality.'),
+      createTestRequest('Templated boilerplate disclaimer.'),
+    ];
+
+    const results = createBrandCheckResponses(profile, requests, '2024-01-01T00:00:00.000Z');
+
+    expect(results).toHaveLength(3);
+    expect(results[2]).toBe(results[0]);
+    expect(results[1]).not.toBe(results[0]);
+  });
+
+  it('should not dedupe across different content types', () => {
+    const profile = createTestProfile();
+    const results = createBrandCheckResponses(profile, [
+      createTestRequest('Shared copy', { contentType: 'ad-copy' }),
+      createTestRequest('Shared copy', { contentType: 'email' }),
+    ]);
+
+    expect(results[1]).not.toBe(results[0]);
+  });
+
+  it('should return an empty array for an empty batch', () => {
+    const profile = createTestProfile();
+    expect(createBrandCheckResponses(profile, [])).toEqual([]);
+  });
+});
+
 describe('createAuditEntry', () => {
   it('should create a valid audit entry', () => {
     const profile = createTestProfile();
@@ -0,0 +1,79 @@
+import { describe, it, expect } from 'vitest';
+import { PhraseMatcher } from '../phrase-matcher.js';
+
+/** Reference implementation: per-pattern includes() */
+function naiveMatch(patterns: string[], text: string): Set<number> {
+  const matched = new Set<number>();
+  for (let i = 0; i < patterns.length; i++) {
+    if (text.includes(patterns[i])) {
+      matched.add(i);
+    }
+  }
+  return matched;
+}
+
+describe('PhraseMatcher', () => {
+  it('should find patterns occurring as substrings', () => {
+    const matcher = new PhraseMatcher(['he', 'she', 'his', 'hers']);
+    expect(matcher.match('ushers')).toEqual(new Set([0, 1, 3]));
+  });
+
+  it('should return an empty set when nothing matches', () => {
+    const matcher = new PhraseMatcher(['foo', 'bar']);
+    expect(matcher.match('nothing here')).toEqual(new Set());
+  });
+
+  it('should match a pattern equal to the whole text', () => {
+    const matcher = new PhraseMatcher(['exact text']);
+    expect(matcher.match('exact text')).toEqual(new Set([0]));
+  });
+
+  it('should match patterns at start and end of text', () => {
+    const matcher = new PhraseMatcher(['start', 'end']);
+    expect(matcher.match('start middle end')).toEqual(new Set([0, 1]));
+  });
+
+  it('should report overlapping patterns independently', () => {
+    const matcher = new PhraseMatcher(['ab', 'abc', 'bc']);
+    expect(matcher.match('xabcx')).toEqual(new Set([0, 1, 2]));
+  });
+
+  it('should handle duplicate patterns as separate indices', () => {
+    const matcher = new PhraseMatcher(['dup', 'dup']);
+    expect(matcher.match('a dup b')).toEqual(new Set([0, 1]));
+  });
+
+  it('should treat an empty pattern as matching any text', () => {
+    const matcher = new PhraseMatcher(['', 'word']);
+    expect(matcher.match('')).toEqual(new Set([0]));
+    expect(matcher.match('no match')).toEqual(new Set([0]));
+  });
+
+  it('should handle an empty pattern list', () => {
+    const matcher = new PhraseMatcher([]);
+    expect(matcher.match('anything')).toEqual(new Set());
+  });
+
+  it('should agree with per-pattern includes() on mixed input', () => {
+    const patterns = [
+      'aggressive',
+      'helpful',
+      'customer',
+      'customer-first',
+      'never say never',
+      'a',
+      'innovation',
+    ];
+    const texts = [
+      'we put the customer-first in everything',
+      'an aggressive but helpful tone',
+      'never say never again',
+      '',
+      'innovation',
+    ];
+    const matcher = new PhraseMatcher(patterns);
+    for (const text of texts) {
+      expect(matcher.match(text)).toEqual(naiveMatch(patterns, text));
+    }
+  });
+});
@@ -1,4 +1,5 @@
 import { createHash } from 'crypto';
+import { PhraseMatcher } from './phrase-matcher.js';
 import {
   BrandProfile,
   BrandCheckRequest,
@@ -15,6 +16,33 @@ export function computeContentHash(content: string): string {
   return createHash('sha256').update(content).digest('hex');
 }
 
+/**
+ * Hash algorithm for internal content fingerprints. BLAKE2b is faster
+ * than SHA-256 on short strings where the OpenSSL build provides it;
+ * probed once at module load.
+ */
+const FINGERPRINT_ALGORITHM = (() => {
+  try {
+    createHash('blake2b512');
+    return 'blake2b512';
+  } catch {
+    return 'sha256';
+  }
+})();
+
+/**
+ * Compute a short non-cryptographic fingerprint for content.
+ *
+ * Used for cache and dedup keys inside the process; the externally
+ * visible contentHash in responses and audit entries stays SHA-256.
+ */
+export function contentFingerprint(content: string): string {
+  return createHash(FINGERPRINT_ALGORITHM)
+    .update(content)
+    .digest('hex')
+    .substring(0, 32);
+}
+
 /**
  * Generate a unique audit ID
  */
@@ -25,11 +53,15 @@ export function generateAuditId(contentHash: string, timestamp: string): string
     .substring(0, 16);
 }
 
+/** Patterns used on every check, compiled once at module load */
+const WHITESPACE_RE = /\s+/g;
+const TOKEN_SPLIT_RE = /[\s.,!?;:'"()\[\]{}]+/;
+
 /**
  * Normalize text for comparison (lowercase, trim, collapse whitespace)
  */
 function normalizeText(text: string): string {
-  return text.toLowerCase().trim().replace(/\s+/g, ' ');
+  return text.toLowerCase().trim().replace(WHITESPACE_RE, ' ');
 }
 
 /**
@@ -37,176 +69,162 @@ function normalizeText(text: string): string {
  */
 function tokenize(text: string): string[] {
   return normalizeText(text)
-    .split(/[\s.,!?;:'"()\[\]{}]+/)
+    .split(TOKEN_SPLIT_RE)
     .filter((word) => word.length > 0);
 }
 
 /**
- * Check if content contains a phrase (case-insensitive)
+ * Memoized phrase normalizations. Profile phrase lists are small and
+ * reused on every check, so each phrase is normalized at most once.
  */
-function containsPhrase(content: string, phrase: string): boolean {
-  const normalizedContent = normalizeText(content);
-  const normalizedPhrase = normalizeText(phrase);
-  return normalizedContent.includes(normalizedPhrase);
+const normalizedPhraseCache = new Map<string, string>();
+
+function normalizePhrase(phrase: string): string {
+  let normalized = normalizedPhraseCache.get(phrase);
+  if (normalized === undefined) {
+    normalized = normalizeText(phrase);
+    normalizedPhraseCache.set(phrase, normalized);
+  }
+  return normalized;
 }
 
 /**
- * Calculate word overlap score between two texts
+ * Calculate word overlap score (Jaccard similarity) between token sets
  */
-function calculateWordOverlap(text1: string, text2: string): number {
-  const words1 = new Set(tokenize(text1));
-  const words2 = new Set(tokenize(text2));
-
+function calculateWordOverlap(
+  words1: ReadonlySet<string>,
+  words2: ReadonlySet<string>
+): number {
   if (words1.size === 0 || words2.size === 0) {
     return 0;
   }
 
+  // Iterate the smaller set for the intersection
+  const [smaller, larger] =
+    words1.size <= words2.size ? [words1, words2] : [words2, words1];
+
   let overlap = 0;
-  for (const word of words1) {
-    if (words2.has(word)) {
+  for (const word of smaller) {
+    if (larger.has(word)) {
       overlap++;
     }
   }
 
-  // Jaccard similarity
-  const union = new Set([...words1, ...words2]).size;
-  return overlap / union;
+  // Jaccard similarity; |A ∪ B| = |A| + |B| - |A ∩ B|, no union set needed
+  return overlap / (words1.size + words2.size - overlap);
 }
 
 /**
- * Check content against "never" rules
+ * Grouped outcome of the fused phrase pass over all profile buckets
  */
-function checkNeverRules(
-  content: string,
-  neverRules: readonly string[]
-): { violated: string[]; passed: string[] } {
-  const violated: string[] = [];
-  const passed: string[] = [];
-
-  for (const rule of neverRules) {
-    if (containsPhrase(content, rule)) {
-      violated.push(rule);
-    } else {
-      passed.push(rule);
-    }
-  }
-
-  // Sort for determinism
-  violated.sort();
-  passed.sort();
-
-  return { violated, passed };
+interface PhraseCheckResult {
+  neverViolated: string[];
+  neverPassed: string[];
+  toneAcceptableFound: string[];
+  toneUnacceptableFound: string[];
+  valuesAligned: string[];
+  valuesMissing: string[];
+  voiceAligned: string[];
+  voiceMissing: string[];
 }
 
 /**
- * Check content against voice descriptors
- */
-function checkVoiceAlignment(
-  content: string,
-  voiceDescriptors: readonly string[]
-): { aligned: string[]; missing: string[] } {
-  const aligned: string[] = [];
-  const missing: string[] = [];
-
-  for (const descriptor of voiceDescriptors) {
-    // Simple keyword check - in production this would use embeddings
-    if (containsPhrase(content, descriptor)) {
-      aligned.push(descriptor);
-    } else {
-      missing.push(descriptor);
-    }
-  }
-
-  // Sort for determinism
-  aligned.sort();
-  missing.sort();
-
-  return { aligned, missing };
-}
-
-/**
- * Check content against tone boundaries
+ * Bucket automaton matches for every profile phrase in a single loop.
+ *
+ * Never rules, tone boundaries, values, and voice descriptors (a simple
+ * keyword check - in production this would use embeddings) used to be
+ * separate loops; one pass over the flat tagged phrase list fills all
+ * result groups at once.
  */
-function checkToneBoundaries(
-  content: string,
-  acceptable: readonly string[],
-  unacceptable: readonly string[]
-): { acceptableFound: string[]; unacceptableFound: string[] } {
-  const acceptableFound: string[] = [];
-  const unacceptableFound: string[] = [];
-
-  for (const tone of acceptable) {
-    if (containsPhrase(content, tone)) {
-      acceptableFound.push(tone);
-    }
-  }
+function bucketPhraseMatches(
+  matched: ReadonlySet<number>,
+  phrases: readonly PhraseEntry[]
+): PhraseCheckResult {
+  const result: PhraseCheckResult = {
+    neverViolated: [],
+    neverPassed: [],
+    toneAcceptableFound: [],
+    toneUnacceptableFound: [],
+    valuesAligned: [],
+    valuesMissing: [],
+    voiceAligned: [],
+    voiceMissing: [],
+  };
 
-  for (const tone of unacceptable) {
-    if (containsPhrase(content, tone)) {
-      unacceptableFound.push(tone);
+  for (const { bucket, phrase, index } of phrases) {
+    const hit = matched.has(index);
+    switch (bucket) {
+      case 'never':
+        (hit ? result.neverViolated : result.neverPassed).push(phrase);
+        break;
+      case 'tone-acceptable':
+        if (hit) {
+          result.toneAcceptableFound.push(phrase);
+        }
+        break;
+      case 'tone-unacceptable':
+        if (hit) {
+          result.toneUnacceptableFound.push(phrase);
+        }
+        break;
+      case 'value':
+        (hit ? result.valuesAligned : result.valuesMissing).push(phrase);
+        break;
+      case 'voice':
+        (hit ? result.voiceAligned : result.voiceMissing).push(phrase);
+        break;
     }
   }
 
-  // Sort for determinism
-  acceptableFound.sort();
-  unacceptableFound.sort();
-
-  return { acceptableFound, unacceptableFound };
-}
-
-/**
- * Check content against brand values
- */
-function checkValueAlignment(
-  content: string,
-  values: readonly string[]
-): { aligned: string[]; missing: string[] } {
-  const aligned: string[] = [];
-  const missing: string[] = [];
-
-  for (const value of values) {
-    if (containsPhrase(content, value)) {
-      aligned.push(value);
-    } else {
-      missing.push(value);
+  // Sort in place for determinism; empty and single-element lists are
+  // already ordered
+  for (const list of [
+    result.neverViolated,
+    result.neverPassed,
+    result.toneAcceptableFound,
+    result.toneUnacceptableFound,
+    result.valuesAligned,
+    result.valuesMissing,
+    result.voiceAligned,
+    result.voiceMissing,
+  ]) {
+    if (list.length > 1) {
+      list.sort();
     }
   }
 
-  // Sort for determinism
-  aligned.sort();
-  missing.sort();
-
-  return { aligned, missing };
+  return result;
 }
 
 /**
  * Calculate similarity with canonical examples
+ *
+ * Example token sets are precomputed per profile, so each check only
+ * tokenizes the content once and does cheap set intersections here.
  */
 function checkExampleSimilarity(
-  content: string,
-  examples: BrandProfile['examples']
+  contentTokens: ReadonlySet<string>,
+  goodExamples: readonly PreparedExample[],
+  badExamples: readonly PreparedExample[]
 ): { goodSimilarity: number; badSimilarity: number; bestMatch: string | null } {
-  const goodExamples = examples.filter((e) => e.type === 'good');
-  const badExamples = examples.filter((e) => e.type === 'bad');
-
   let goodSimilarity = 0;
   let badSimilarity = 0;
   let bestMatch: string | null = null;
   let bestScore = 0;
 
   for (const example of goodExamples) {
-    const score = calculateWordOverlap(content, example.content);
+    const score = calculateWordOverlap(contentTokens, example.tokens);
     if (score > goodSimilarity) {
       goodSimilarity = score;
     }
     if (score > bestScore) {
       bestScore = score;
-      bestMatch = example.content.substring(0, 50) + (example.content.length > 50 ? '...' : '');
+      bestMatch = example.preview;
     }
   }
 
   for (const example of badExamples) {
-    const score = calculateWordOverlap(content, example.content);
+    const score = calculateWordOverlap(contentTokens, example.tokens);
     if (score > badSimilarity) {
       badSimilarity = score;
     }
@@ -231,6 +249,175 @@ interface BrandCheckResult {
   };
 }
 
+/**
+ * Maximum number of check results kept in the in-process LRU cache
+ */
+const CHECK_CACHE_MAX_ENTRIES = 1024;
+
+/**
+ * Maximum entries in the per-content memo caches (tokens, hashes)
+ */
+const CONTENT_CACHE_MAX_ENTRIES = 128;
+
+/**
+ * Bounded LRU lookup: refresh the entry on hit, evict the least
+ * recently used entry on insert once the cache is full.
+ */
+function lruGet<V>(
+  cache: Map<string, V>,
+  key: string,
+  maxEntries: number,
+  compute: () => V
+): V {
+  const cached = cache.get(key);
+  if (cached !== undefined) {
+    cache.delete(key);
+    cache.set(key, cached);
+    return cached;
+  }
+  const value = compute();
+  if (cache.size >= maxEntries) {
+    cache.delete(cache.keys().next().value as string);
+  }
+  cache.set(key, value);
+  return value;
+}
+
+/**
+ * Memoized content token sets keyed by normalized-content fingerprint,
+ * and memoized external content hashes keyed by raw content. Both are
+ * recomputed across back-to-back checks of the same content otherwise
+ * (retries, checks against several profiles).
+ */
+const contentTokenCache = new Map<string, ReadonlySet<string>>();
+const contentHashCache = new Map<string, string>();
+
+function memoizedContentHash(content: string): string {
+  return lruGet(contentHashCache, content, CONTENT_CACHE_MAX_ENTRIES, () =>
+    computeContentHash(content)
+  );
+}
+
+/**
+ * LRU cache of check results, keyed by profile hash + content hash.
+ * Checks are deterministic, so a cached result is always valid for the
+ * same (profile, content) pair.
+ */
+const checkCache = new Map<string, BrandCheckResult>();
+
+/**
+ * Memoized cache keys per profile object (hash of the profile contents)
+ */
+const profileKeys = new WeakMap<BrandProfile, string>();
+
+function profileCacheKey(profile: BrandProfile): string {
+  let key = profileKeys.get(profile);
+  if (key === undefined) {
+    key = contentFingerprint(JSON.stringify(profile));
+    profileKeys.set(profile, key);
+  }
+  return key;
+}
+
+/** Profile phrase buckets checked in the fused pass */
+export type PhraseBucket =
+  | 'never'
+  | 'tone-acceptable'
+  | 'tone-unacceptable'
+  | 'value'
+  | 'voice';
+
+/**
+ * Original profile phrase tagged with its bucket and its pattern index
+ * in the profile matcher
+ */
+export interface PhraseEntry {
+  bucket: PhraseBucket;
+  phrase: string;
+  index: number;
+}
+
+/**
+ * Profile example with its token set and display preview precomputed
+ */
+export interface PreparedExample {
+  tokens: Set<string>;
+  preview: string;
+}
+
+/**
+ * A brand profile projected into the flat structures the checker
+ * iterates: every normalized phrase across all buckets lives in one
+ * automaton, the tagged phrase list carries originals with their
+ * pattern indices, and example token sets are prebuilt. Built once per
+ * profile object; treat as immutable.
+ */
+export interface PreparedBrandProfile {
+  matcher: PhraseMatcher;
+  phrases: readonly PhraseEntry[];
+  goodExamples: readonly PreparedExample[];
+  badExamples: readonly PreparedExample[];
+  version: string;
+}
+
+/**
+ * Memoized prepared views per profile object
+ */
+const preparedProfileCache = new WeakMap<BrandProfile, PreparedBrandProfile>();
+
+/**
+ * Build (or return the cached) prepared view of a profile. Loaders can
+ * call this after validation to pay the automaton build cost up front
+ * instead of on the first check.
+ */
+export function prepareBrandProfile(profile: BrandProfile): PreparedBrandProfile {
+  let prepared = preparedProfileCache.get(profile);
+  if (prepared !== undefined) {
+    return prepared;
+  }
+
+  const patterns: string[] = [];
+  const phrases: PhraseEntry[] = [];
+  const addBucket = (bucket: PhraseBucket, list: readonly string[]): void => {
+    for (const phrase of list) {
+      phrases.push({ bucket, phrase, index: patterns.length });
+      patterns.push(normalizePhrase(phrase));
+    }
+  };
+
+  addBucket('never', profile.neverRules);
+  addBucket('tone-acceptable', profile.toneAcceptable);
+  addBucket('tone-unacceptable', profile.toneUnacceptable);
+  addBucket('value', profile.values);
+  addBucket('voice', profile.voiceDescriptors);
+
+  const prepareExample = (example: BrandProfile['examples'][number]): PreparedExample => ({
+    tokens: new Set(tokenize(example.content)),
+    preview: example.content.substring(0, 50) + (example.content.length > 50 ? '...' : ''),
+  });
+  const goodExamples = profile.examples.filter((e) => e.type === 'good').map(prepareExample);
+  const badExamples = profile.examples.filter((e) => e.type === 'bad').map(prepareExample);
+
+  prepared = {
+    matcher: new PhraseMatcher(patterns),
+    phrases,
+    goodExamples,
+    badExamples,
+    version: profile.version,
+  };
+  preparedProfileCache.set(profile, prepared);
+  return prepared;
+}
+
+/**
+ * Clear the in-process brand check result cache
+ */
+export function clearBrandCheckCache(): void {
+  checkCache.clear();
+  contentTokenCache.clear();
+  contentHashCache.clear();
+}
+
 /**
  * Core brand consistency check - deterministic logic
  *
@@ -249,37 +436,66 @@ interface BrandCheckResult {
  * - OFF-BRAND: Any critical violation (never rules, unacceptable tone, high bad example similarity)
  * - BORDERLINE: Low scores or warnings without critical violations
  * - ON-BRAND: Good alignment without violations
+ *
+ * Results are cached in a bounded LRU keyed by profile and content hash;
+ * callers must treat the returned result as immutable.
  */
 export function checkBrandConsistency(
   profile: BrandProfile,
   request: BrandCheckRequest
 ): BrandCheckResult {
   const content = request.content;
-  const explanations: BrandExplanation[] = [];
 
-  // 1. Check never rules (critical)
-  const neverCheck = checkNeverRules(content, profile.neverRules);
+  // Normalize once; the cache key and every phrase check below work on
+  // the normalized text
+  const normalizedContent = normalizeText(content);
 
-  // 2. Check tone boundaries
-  const toneCheck = checkToneBoundaries(
-    content,
-    profile.toneAcceptable,
-    profile.toneUnacceptable
-  );
+  // Key on normalized content: the check only sees normalized text, so
+  // case- and whitespace-variants of the same copy share one entry
+  const fingerprint = contentFingerprint(normalizedContent);
+  const cacheKey = `${profileCacheKey(profile)}|${fingerprint}|${request.contentType ?? ''}`;
+  const cached = checkCache.get(cacheKey);
+  if (cached !== undefined) {
+    // Refresh recency so frequently checked content stays cached
+    checkCache.delete(cacheKey);
+    checkCache.set(cacheKey, cached);
+    return cached;
+  }
 
-  // 3. Check example similarity
-  const exampleCheck = checkExampleSimilarity(content, profile.examples);
+  // Explanations bucketed by severity at insertion time; concatenating
+  // the buckets yields severity order without a sort
+  const critical: BrandExplanation[] = [];
+  const warning: BrandExplanation[] = [];
+  const info: BrandExplanation[] = [];
+  const explanationCount = (): number =>
+    critical.length + warning.length + info.length;
+
+  // Single pass over the content finds every matching profile phrase,
+  // and a single loop over the tagged phrase list buckets the results
+  // (never rules, tone boundaries, values, voice)
+  const prepared = prepareBrandProfile(profile);
+  const matched = prepared.matcher.match(normalizedContent);
+  const phraseCheck = bucketPhraseMatches(matched, prepared.phrases);
+
+  // Check example similarity (content tokenized once, memoized across
+  // checks of the same content against different profiles)
+  const contentTokens = lruGet(
+    contentTokenCache,
+    fingerprint,
+    CONTENT_CACHE_MAX_ENTRIES,
+    (): ReadonlySet<string> => new Set(tokenize(normalizedContent))
+  );
+  const exampleCheck = checkExampleSimilarity(
+    contentTokens,
+    prepared.goodExamples,
+    prepared.badExamples
+  );
 
-  // 4. Check value alignment
-  const valueCheck = checkValueAlignment(content, profile.values);
   const valueScore = profile.values.length > 0
-    ? valueCheck.aligned.length / profile.values.length
+    ? phraseCheck.valuesAligned.length / profile.values.length
     : 1;
-
-  // 5. Check voice alignment
-  const voiceCheck = checkVoiceAlignment(content, profile.voiceDescriptors);
   const voiceScore = profile.voiceDescriptors.length > 0
-    ? voiceCheck.aligned.length / profile.voiceDescriptors.length
+    ? phraseCheck.voiceAligned.length / profile.voiceDescriptors.length
     : 1;
 
   // Determine status and build explanations
@@ -287,23 +503,23 @@ export function checkBrandConsistency(
   let confidence = 85; // Base confidence
 
   // Critical: Never rule violations
-  if (neverCheck.violated.length > 0) {
+  if (phraseCheck.neverViolated.length > 0) {
     status = 'off-brand';
     confidence = 95;
-    explanations.push({
-      text: `Contains prohibited content: "${neverCheck.violated[0]}"`,
+    critical.push({
+      text: `Contains prohibited content: "${phraseCheck.neverViolated[0]}"`,
       aspect: 'never-rule',
       severity: 'critical',
     });
   }
 
   // Critical: Unacceptable tone
-  if (toneCheck.unacceptableFound.length > 0) {
+  if (phraseCheck.toneUnacceptableFound.length > 0) {
     status = 'off-brand';
     confidence = Math.max(confidence, 90);
-    if (explanations.length < 3) {
-      explanations.push({
-        text: `Uses unacceptable tone: "${toneCheck.unacceptableFound[0]}"`,
+    if (explanationCount() < 3) {
+      critical.push({
+        text: `Uses unacceptable tone: "${phraseCheck.toneUnacceptableFound[0]}"`,
         aspect: 'tone',
         severity: 'critical',
       });
@@ -316,11 +532,12 @@ export function checkBrandConsistency(
       status = exampleCheck.badSimilarity > 0.5 ? 'off-brand' : 'borderline';
     }
     confidence = Math.max(confidence, 80);
-    if (explanations.length < 3) {
-      explanations.push({
+    if (explanationCount() < 3) {
+      const severe = exampleCheck.badSimilarity > 0.5;
+      (severe ? critical : warning).push({
         text: `Content resembles known off-brand examples`,
         aspect: 'example-match',
-        severity: exampleCheck.badSimilarity > 0.5 ? 'critical' : 'warning',
+        severity: severe ? 'critical' : 'warning',
       });
     }
   }
@@ -341,21 +558,21 @@ export function checkBrandConsistency(
   }
 
   // Add positive or constructive explanations
-  if (explanations.length === 0) {
+  if (explanationCount() === 0) {
     if (exampleCheck.goodSimilarity > 0.3) {
-      explanations.push({
+      info.push({
         text: `Content aligns well with established brand examples`,
         aspect: 'example-match',
         severity: 'info',
       });
     } else if (valueScore > 0.5) {
-      explanations.push({
-        text: `Content reflects brand values: ${valueCheck.aligned.slice(0, 2).join(', ')}`,
+      info.push({
+        text: `Content reflects brand values: ${phraseCheck.valuesAligned.slice(0, 2).join(', ')}`,
         aspect: 'value',
         severity: 'info',
       });
     } else {
-      explanations.push({
+      info.push({
         text: `Content is acceptable but could better reflect brand values`,
         aspect: 'value',
         severity: 'info',
@@ -364,10 +581,10 @@ export function checkBrandConsistency(
   }
 
   // Add voice alignment explanation if space
-  if (explanations.length < 3 && voiceScore < 0.5 && status !== 'off-brand') {
-    const missingVoice = voiceCheck.missing.slice(0, 2).join(', ');
+  if (explanationCount() < 3 && voiceScore < 0.5 && status !== 'off-brand') {
+    const missingVoice = phraseCheck.voiceMissing.slice(0, 2).join(', ');
     if (missingVoice) {
-      explanations.push({
+      info.push({
         text: `Voice could better emphasize: ${missingVoice}`,
         aspect: 'voice',
         severity: 'info',
@@ -376,17 +593,17 @@ export function checkBrandConsistency(
   }
 
   // Add acceptable tone explanation if space
-  if (explanations.length < 3 && toneCheck.acceptableFound.length > 0) {
-    explanations.push({
-      text: `Good use of brand tone: ${toneCheck.acceptableFound.slice(0, 2).join(', ')}`,
+  if (explanationCount() < 3 && phraseCheck.toneAcceptableFound.length > 0) {
+    info.push({
+      text: `Good use of brand tone: ${phraseCheck.toneAcceptableFound.slice(0, 2).join(', ')}`,
       aspect: 'tone',
       severity: 'info',
     });
   }
 
   // Ensure we have at least one explanation
-  if (explanations.length === 0) {
-    explanations.push({
+  if (explanationCount() === 0) {
+    info.push({
       text: status === 'on-brand'
         ? 'Content aligns with brand guidelines'
         : 'Content requires review for brand alignment',
@@ -394,22 +611,16 @@ export function checkBrandConsistency(
     });
   }
 
-  // Sort explanations by severity for determinism
-  explanations.sort((a, b) => {
-    const severityOrder = { critical: 0, warning: 1, info: 2 };
-    return severityOrder[a.severity] - severityOrder[b.severity];
-  });
-
-  // Limit to 3 explanations
-  const finalExplanations = explanations.slice(0, 3);
+  // Concatenate severity buckets (already in order) and limit to 3
+  const finalExplanations = [...critical, ...warning, ...info].slice(0, 3);
 
-  return {
+  const result: BrandCheckResult = {
     status,
     explanations: finalExplanations,
     confidence,
     details: {
-      neverRuleViolations: neverCheck.violated,
-      unacceptableToneFound: toneCheck.unacceptableFound,
+      neverRuleViolations: phraseCheck.neverViolated,
+      unacceptableToneFound: phraseCheck.toneUnacceptableFound,
       valueAlignmentScore: valueScore,
       voiceAlignmentScore: voiceScore,
       exampleSimilarity: {
@@ -418,6 +629,14 @@ export function checkBrandConsistency(
       },
     },
   };
+
+  // Evict the least recently used entry once the cache is full
+  if (checkCache.size >= CHECK_CACHE_MAX_ENTRIES) {
+    checkCache.delete(checkCache.keys().next().value as string);
+  }
+  checkCache.set(cacheKey, result);
+
+  return result;
 }
 
 /**
@@ -444,7 +663,7 @@ export function createBrandCheckResponse(
 ): BrandCheckResponse {
   const result = checkBrandConsistency(profile, request);
   const checkedAt = timestamp ?? new Date().toISOString();
-  const contentHash = computeContentHash(request.content);
+  const contentHash = memoizedContentHash(request.content);
 
   return {
     status: result.status,
@@ -457,6 +676,83 @@ export function createBrandCheckResponse(
   };
 }
 
+/**
+ * Result of a single item in a batch brand check
+ */
+export type BrandCheckBatchItem =
+  | { status: 'ok'; response: BrandCheckResponse }
+  | { status: 'error'; error: string };
+
+/**
+ * Run brand checks for multiple contents against a single profile,
+ * yielding one item at a time in input order.
+ *
+ * A failure on one item does not abort the batch: failed items are
+ * reported as `{ status: 'error' }` entries so callers can surface
+ * per-item errors alongside successes.
+ *
+ * Identical contents (same hash and content type) are checked once and
+ * share a single response entry, since the check is deterministic. All
+ * items share one checkedAt timestamp, taken once at batch start.
+ *
+ * With `failFast` the first item failure is rethrown instead of being
+ * recorded, for callers that treat any failure as fatal.
+ *
+ * The generator form lets streaming callers emit each result (and yield
+ * the event loop) between checks instead of computing the whole batch
+ * up front; use createBrandCheckResponses for the materialized array.
+ */
+export function* iterateBrandCheckResponses(
+  profile: BrandProfile,
+  requests: readonly BrandCheckRequest[],
+  timestamp?: string,
+  failFast = false
+): Generator<BrandCheckBatchItem, void, undefined> {
+  const seen = new Map<string, BrandCheckBatchItem>();
+  // One timestamp for the whole batch instead of a Date per item
+  const checkedAt = timestamp ?? new Date().toISOString();
+
+  for (const request of requests) {
+    let item: BrandCheckBatchItem;
+    try {
+      const key = `${contentFingerprint(request.content)}|${request.contentType ?? ''}`;
+      const seenItem = seen.get(key);
+      if (seenItem !== undefined) {
+        yield seenItem;
+        continue;
+      }
+
+      item = {
+        status: 'ok',
+        response: createBrandCheckResponse(profile, request, checkedAt),
+      };
+      seen.set(key, item);
+    } catch (error) {
+      if (failFast) {
+        throw error;
+      }
+      item = {
+        status: 'error',
+        error: (error as Error).message,
+      };
+    }
+    yield item;
+  }
+}
+
+/**
+ * Array form of iterateBrandCheckResponses, for callers that want the
+ * whole batch at once.
+ */
+export function createBrandCheckResponses(
+  profile: BrandProfile,
+  requests: readonly BrandCheckRequest[],
+  timestamp?: string,
+  failFast = false
+): BrandCheckBatchItem[] {
+  return [...iterateBrandCheckResponses(profile, requests, timestamp, failFast)];
+}
+
 /**
  * Create an audit log entry from a brand check response
  */
@@ -4,3 +4,4 @@ export * from './validate.js';
 export * from './federation.js';
 export * from './policy.js';
 export * from './brand-checker.js';
+export * from './phrase-matcher.js';
@@ -0,0 +1,94 @@
+/**
+ * Multi-pattern substring matcher (Aho–Corasick).
+ *
+ * Brand checks test every profile phrase against the content with
+ * `includes`, which is O(patterns × content). Building an automaton over
+ * all phrases once per profile lets a check find every matching phrase
+ * in a single pass over the content. Matching semantics are identical to
+ * per-pattern `String.prototype.includes`.
+ */
+
+interface TrieNode {
+  children: Map<string, TrieNode>;
+  /** Indices of patterns ending at this node */
+  outputs: number[];
+  /** Longest proper suffix of this node that is also a trie prefix */
+  fail: TrieNode | null;
+}
+
+function createNode(): TrieNode {
+  return { children: new Map(), outputs: [], fail: null };
+}
+
+export class PhraseMatcher {
+  private readonly root: TrieNode;
+  /** Indices of empty patterns, which match any content */
+  private readonly emptyPatterns: number[];
+  readonly patternCount: number;
+
+  constructor(patterns: readonly string[]) {
+    this.root = createNode();
+    this.emptyPatterns = [];
+    this.patternCount = patterns.length;
+
+    // Build the trie
+    for (let i = 0; i < patterns.length; i++) {
+      const pattern = patterns[i];
+      if (pattern.length === 0) {
+        this.emptyPatterns.push(i);
+        continue;
+      }
+      let node = this.root;
+      for (const char of pattern) {
+        let next = node.children.get(char);
+        if (next === undefined) {
+          next = createNode();
+          node.children.set(char, next);
+        }
+        node = next;
+      }
+      node.outputs.push(i);
+    }
+
+    // Build failure links breadth-first; merge outputs along the links
+    // so every node directly lists all patterns ending at it
+    const queue: TrieNode[] = [];
+    for (const child of this.root.children.values()) {
+      child.fail = this.root;
+      queue.push(child);
+    }
+    for (let head = 0; head < queue.length; head++) {
+      const node = queue[head];
+      for (const [char, child] of node.children) {
+        let fail = node.fail;
+        while (fail !== null && !fail.children.has(char)) {
+          fail = fail.fail;
+        }
+        child.fail = fail?.children.get(char) ?? this.root;
+        child.outputs.push(...child.fail.outputs);
+        queue.push(child);
+      }
+    }
+  }
+
+  /**
+   * Scan text once and return the indices of all patterns that occur in
+   * it as substrings.
+   */
+  match(text: string): Set<number> {
+    const matched = new Set<number>(this.emptyPatterns);
+    let node = this.root;
+
+    for (const char of text) {
+      while (node !== this.root && !node.children.has(char)) {
+        node = node.fail ?? this.root;
+      }
+      node = node.children.get(char) ?? this.root;
+      for (const index of node.outputs) {
+        matched.add(index);
+      }
+    }
+
+    return matched;
+  }
+}
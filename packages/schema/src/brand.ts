@@ -1,5 +1,10 @@
 import { z } from 'zod';
 
+/**
+ * Semver pattern (major.minor.patch), compiled once at module load
+ */
+const SEMVER_RE = /^\d+\.\d+\.\d+$/;
+
 /**
  * Brand alignment status values
  */
@@ -16,6 +21,12 @@ export const BrandExample = z.object({
 });
 export type BrandExample = z.infer<typeof BrandExample>;
 
+/**
+ * List of brand examples, hoisted so bulk parsing reuses one validator
+ */
+export const BrandExampleList = z.array(BrandExample);
+export type BrandExampleList = z.infer<typeof BrandExampleList>;
+
 /**
  * Brand Profile - the source of truth for brand consistency
  */
@@ -24,7 +35,7 @@ export const BrandProfile = z.object({
   name: z.string().min(1),
 
   /** Profile version (semver format recommended) */
-  version: z.string().regex(/^\d+\.\d+\.\d+$/, 'Version must be in semver format (e.g., 1.0.0)'),
+  version: z.string().regex(SEMVER_RE, 'Version must be in semver format (e.g., 1.0.0)'),
 
   /** Brand values (5-10 recommended) */
   values: z.array(z.string().min(1)).min(1).max(20),
@@ -42,7 +53,7 @@ export const BrandProfile = z.object({
   neverRules: z.array(z.string().min(1)).default([]),
 
   /** Canonical examples of brand content */
-  examples: z.array(BrandExample).default([]),
+  examples: BrandExampleList.default([]),
 
   /** Optional description of the brand */
   description: z.string().optional(),
@@ -80,6 +91,14 @@ export const BrandCheckRequest = z.object({
 });
 export type BrandCheckRequest = z.infer<typeof BrandCheckRequest>;
 
+/**
+ * Non-empty list of check requests for batch ingress; validating a
+ * whole batch through this prebuilt schema is cheaper than a per-item
+ * loop and reports indexed paths in errors
+ */
+export const BrandCheckRequestList = z.array(BrandCheckRequest).min(1);
+export type BrandCheckRequestList = z.infer<typeof BrandCheckRequestList>;
+
 /**
  * Explanation bullet point for brand check result
  */